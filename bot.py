@@ -6,17 +6,123 @@ checks if company is in indexes, generates summary with ChatGPT,
 and posts to Twitter as a thread.
 """
 
-import yfinance as yf
-import pandas as pd
+import csv
+import functools
 import json
 import time
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
-import openai
-import tweepy
+import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Dict, List, Optional, Set, Tuple
+import diskcache
+import orjson
 from pathlib import Path
 
+# yfinance, openai, tweepy and requests are slow to import, so they are
+# imported where first used; this keeps `--help` and imports of this module fast
+
+# Yahoo's quote endpoint accepts a comma-separated list of symbols
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+QUOTE_BATCH_SIZE = 20
+
+# How long ChatGPT summaries and partial-thread progress are kept (90 days)
+SUMMARY_CACHE_SECONDS = 90 * 86400
+
+# Quarter for each month, indexed by month - 1
+_QUARTER = ('Q1', 'Q1', 'Q1', 'Q2', 'Q2', 'Q2', 'Q3', 'Q3', 'Q3', 'Q4', 'Q4', 'Q4')
+
+# Extracts a JSON object embedded in a free-form ChatGPT response
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Transient HTTP statuses worth retrying, besides any 5xx
+_RETRY_STATUS_CODES = (408, 409, 429)
+
+# Distinguishes "not cached" from a cached None (no earnings date)
+_CACHE_MISS = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _yahoo_retry_errors() -> Tuple[type, ...]:
+    """Yahoo errors worth retrying, imported on first use."""
+    # yfinance >= 0.2.58 makes its requests through curl_cffi
+    from curl_cffi.requests.exceptions import ConnectionError, HTTPError
+    from yfinance.exceptions import YFRateLimitError
+    return (YFRateLimitError, HTTPError, ConnectionError)
+
+
+@functools.lru_cache(maxsize=None)
+def _openai_retry_errors() -> Tuple[type, ...]:
+    """OpenAI errors worth retrying, imported on first use."""
+    import openai
+    # APIStatusError covers 429 and 5xx (filtered by status in
+    # _call_with_backoff); APIConnectionError includes timeouts
+    return (openai.APIStatusError, openai.APIConnectionError)
+
+
+def _call_with_backoff(fn, retry_on: Tuple[type, ...], max_retries: int = 5, base: float = 1.0):
+    """
+    Call fn, retrying retry_on errors with exponential backoff.
+    HTTP errors are only retried for transient statuses (408, 409, 429, 5xx),
+    the same set the OpenAI SDK retries. Waits for the Retry-After header
+    when the response includes one.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except retry_on as e:
+            response = getattr(e, 'response', None)
+            status_code = getattr(response, 'status_code', None)
+            if status_code is not None and not (
+                    status_code in _RETRY_STATUS_CODES or status_code >= 500):
+                raise
+            if attempt == max_retries:
+                raise
+            
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                # Missing or an HTTP date: 1s, 2s, 4s, 8s... plus jitter
+                delay = base * 2 ** attempt + random.uniform(0, 0.5)
+            
+            print(f"Request failed ({e}), retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Holds up to capacity tokens, refilled continuously at refill_rate per second.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.condition = threading.Condition()
+    
+    def acquire(self, n: float = 1):
+        """Block until n tokens are available, then take them."""
+        # A request larger than the bucket could never be satisfied
+        n = min(n, self.capacity)
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.refill_rate
+                )
+                self.updated = now
+                
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                self.condition.wait((n - self.tokens) / self.refill_rate)
+
 
 class EarningsBot:
     def __init__(self, config_path: str = "config.json"):
@@ -27,105 +133,258 @@ class EarningsBot:
         # Load company index
         self.companies = self._load_companies()
         
+        # Earnings calendars change a few times a year, so reuse recent lookups
+        self.calendar_cache = diskcache.Cache('.yf_cache')
+        
+        # Summaries are the costliest step, so keep them across restarts and
+        # failed posts until the thread goes out
+        self.summary_cache = diskcache.Cache('.gpt_cache')
+        
+        # Shared rate limits across worker threads (per-minute quotas)
+        yf_rpm = self.config.get('yf_requests_per_minute', 120)
+        openai_rpm = self.config.get('openai_requests_per_minute', 500)
+        openai_tpm = self.config.get('openai_tokens_per_minute', 200000)
+        self.yf_bucket = TokenBucket(yf_rpm, yf_rpm / 60)
+        self.openai_rpm_bucket = TokenBucket(openai_rpm, openai_rpm / 60)
+        self.openai_tpm_bucket = TokenBucket(openai_tpm, openai_tpm / 60)
+        
         # Initialize APIs
-        self.openai_client = openai.OpenAI(api_key=self.config['openai_api_key'])
-        self.twitter_api = self._init_twitter()
+        import openai
+        # Retries are handled by _call_with_backoff; the SDK's own would stack on top
+        self.openai_client = openai.OpenAI(
+            api_key=self.config['openai_api_key'],
+            max_retries=0
+        )
+        self.twitter_client = self._init_twitter()
         
         # Track processed transcripts
-        self.processed_file = "processed_transcripts.json"
-        self.processed = self._load_processed()
+        self.processed_file = "processed_transcripts.jsonl"
+        self._processed_keys = self._load_processed()
     
     def _load_companies(self) -> Dict[str, str]:
         """Load companies from combined index CSV."""
-        df = pd.read_csv('Indexes Listed/combined-indexes.csv')
-        return dict(zip(df['Ticker'], df['Company Name']))
+        with open('Indexes Listed/combined-indexes.csv', newline='') as f:
+            return {row['Ticker']: row['Company Name'] for row in csv.DictReader(f)}
     
     def _init_twitter(self):
         """Initialize Twitter API client."""
-        auth = tweepy.OAuthHandler(
-            self.config['twitter_consumer_key'],
-            self.config['twitter_consumer_secret']
-        )
-        auth.set_access_token(
-            self.config['twitter_access_token'],
-            self.config['twitter_access_token_secret']
+        import requests
+        import tweepy
+        
+        # Raw responses expose the x-rate-limit-* headers
+        return tweepy.Client(
+            consumer_key=self.config['twitter_consumer_key'],
+            consumer_secret=self.config['twitter_consumer_secret'],
+            access_token=self.config['twitter_access_token'],
+            access_token_secret=self.config['twitter_access_token_secret'],
+            return_type=requests.Response
         )
-        return tweepy.API(auth)
     
-    def _load_processed(self) -> List[Dict]:
-        """Load list of processed transcripts."""
+    def _load_processed(self) -> Set[Tuple[str, str, str]]:
+        """
+        Load (ticker, quarter, year) keys of processed transcripts.
+        The full records (one JSON object per line) stay on disk only.
+        """
+        legacy_file = "processed_transcripts.json"
+        if not os.path.exists(self.processed_file) and os.path.exists(legacy_file):
+            # Convert the old single-JSON-array format. Write to a temp file
+            # first so a crash can't leave a partial log that blocks re-migration
+            with open(legacy_file, 'rb') as f:
+                entries = orjson.loads(f.read())
+            tmp_file = self.processed_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                for entry in entries:
+                    f.write(orjson.dumps(entry) + b'\n')
+            os.replace(tmp_file, self.processed_file)
+        
+        processed = set()
         if os.path.exists(self.processed_file):
-            with open(self.processed_file, 'r') as f:
-                return json.load(f)
-        return []
+            with open(self.processed_file, 'rb+') as f:
+                valid_end = 0
+                for line in f:
+                    try:
+                        item = orjson.loads(line)
+                    except ValueError:
+                        if not line.endswith(b'\n'):
+                            # Torn final line from an interrupted append; cut it
+                            # off so the next append doesn't land on the same line
+                            f.truncate(valid_end)
+                            break
+                        # Blank or otherwise unreadable line
+                        valid_end += len(line)
+                        continue
+                    
+                    valid_end += len(line)
+                    processed.add((item['ticker'], item['quarter'], item['year']))
+                    if not line.endswith(b'\n'):
+                        # Complete final record without a newline (e.g. edited
+                        # by hand); terminate it so the next append starts fresh
+                        f.write(b'\n')
+        return processed
     
-    def _save_processed(self):
-        """Save processed transcripts list."""
-        with open(self.processed_file, 'w') as f:
-            json.dump(self.processed, f, indent=2)
+    def _save_processed(self, entry: Dict):
+        """Append one processed transcript to the processed file."""
+        with open(self.processed_file, 'ab') as f:
+            f.write(orjson.dumps(entry) + b'\n')
     
     def _is_processed(self, ticker: str, quarter: str, year: str) -> bool:
         """Check if transcript has been processed."""
-        for item in self.processed:
-            if (item['ticker'] == ticker and 
-                item['quarter'] == quarter and 
-                item['year'] == year):
-                return True
-        return False
+        return (ticker, quarter, year) in self._processed_keys
     
     def _mark_processed(self, ticker: str, quarter: str, year: str, link: str):
         """Mark transcript as processed."""
-        self.processed.append({
+        entry = {
             'ticker': ticker,
             'quarter': quarter,
             'year': year,
             'link': link,
             'timestamp': datetime.now().isoformat()
-        })
-        self._save_processed()
+        }
+        self._processed_keys.add((ticker, quarter, year))
+        self._save_processed(entry)
     
     def check_earnings_data(self, ticker: str) -> Optional[Dict]:
         """
         Check if company has new earnings data.
         Returns dict with earnings info if available.
         """
+        import yfinance as yf
+        
         try:
             stock = yf.Ticker(ticker)
-            info = stock.info
             
             # Get earnings calendar
+            self.yf_bucket.acquire()
+            # yfinance swallows HTTP errors here and returns an empty
+            # calendar, so there is nothing for _call_with_backoff to retry
             earnings_calendar = stock.calendar
             
-            if earnings_calendar is not None and not earnings_calendar.empty:
-                # Get most recent earnings date
-                latest_date = earnings_calendar.index[-1]
-                quarter = self._get_quarter(latest_date)
-                year = latest_date.year
-                
-                return {
-                    'ticker': ticker,
-                    'company_name': info.get('longName', ticker),
-                    'quarter': quarter,
-                    'year': year,
-                    'earnings_date': latest_date.strftime('%Y-%m-%d'),
-                    'link': f"https://finance.yahoo.com/quote/{ticker}/events?p={ticker}"
-                }
+            # Calendar is a dict; 'Earnings Date' lists the expected date
+            # (or the start and end of its window)
+            earnings_dates = (earnings_calendar or {}).get('Earnings Date')
+            if earnings_dates:
+                return self._build_earnings_info(ticker, earnings_dates[0])
         except Exception as e:
             print(f"Error checking earnings for {ticker}: {e}")
         
         return None
     
-    def _get_quarter(self, date) -> str:
+    def _build_earnings_info(self, ticker: str, latest_date) -> Dict:
+        """Build the earnings info dict for a ticker's latest earnings date."""
+        return {
+            'ticker': ticker,
+            'company_name': self.companies.get(ticker, ticker),
+            'quarter': self._get_quarter(latest_date),
+            'year': latest_date.year,
+            'earnings_date': latest_date.strftime('%Y-%m-%d'),
+            'link': f"https://finance.yahoo.com/quote/{ticker}/events?p={ticker}"
+        }
+    
+    def _fetch_quotes(self, tickers: List[str]) -> List[Dict]:
+        """Fetch quote data for up to QUOTE_BATCH_SIZE tickers in one request."""
+        from yfinance.data import YfData
+        
+        def fetch():
+            # Every attempt, including retries, takes a Yahoo token
+            self.yf_bucket.acquire()
+            # YfData handles Yahoo's cookie/crumb authentication for us
+            return YfData().get_raw_json(
+                YAHOO_QUOTE_URL,
+                params={
+                    'symbols': ','.join(tickers),
+                    # Only the earnings date is used; company names come from the CSV
+                    'fields': 'symbol,earningsTimestamp',
+                    'formatted': 'false'
+                }
+            )
+        
+        data = _call_with_backoff(fetch, _yahoo_retry_errors())
+        return data['quoteResponse']['result']
+    
+    def _fetch_calendars_batch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """
+        Check earnings data for many tickers at once.
+        Serves tickers already looked up today from the calendar cache, then
+        queries the quote endpoint QUOTE_BATCH_SIZE symbols at a time and
+        falls back to per-ticker calendar lookups for symbols missing from a
+        successful batch response. Tickers in failed batches are left for the
+        next cycle. Returns dict of earnings info keyed by ticker.
+        """
+        today = date.today().isoformat()
+        results = {}
+        uncached = []
+        for ticker in tickers:
+            earnings_info = self.calendar_cache.get((ticker, today), default=_CACHE_MISS)
+            if earnings_info is _CACHE_MISS:
+                uncached.append(ticker)
+            elif earnings_info:
+                results[ticker] = earnings_info
+        
+        print(f"{len(tickers) - len(uncached)} tickers cached, fetching {len(uncached)}...")
+        
+        requested = []
+        found = set()
+        chunks = [
+            uncached[i:i + QUOTE_BATCH_SIZE]
+            for i in range(0, len(uncached), QUOTE_BATCH_SIZE)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=self.config.get('yf_threads', 16)) as executor:
+            futures = {executor.submit(self._fetch_quotes, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    quotes = future.result()
+                except Exception as e:
+                    print(f"Error fetching quotes for {', '.join(futures[future])}: {e}")
+                    continue
+                
+                requested.extend(futures[future])
+                for quote in quotes:
+                    ticker = quote.get('symbol')
+                    found.add(ticker)
+                    earnings_info = None
+                    timestamp = quote.get('earningsTimestamp')
+                    if timestamp:
+                        earnings_info = self._build_earnings_info(
+                            ticker, datetime.fromtimestamp(timestamp)
+                        )
+                        results[ticker] = earnings_info
+                    self._cache_calendar(ticker, today, earnings_info)
+            
+            # Falling back for a failed (e.g. throttled) batch would turn one
+            # request into QUOTE_BATCH_SIZE, so only retry symbols Yahoo skipped
+            missing = [ticker for ticker in requested if ticker not in found]
+            futures = {
+                executor.submit(self.check_earnings_data, ticker): ticker
+                for ticker in missing
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    earnings_info = future.result()
+                except Exception as e:
+                    print(f"Error processing {ticker}: {e}")
+                    continue
+                
+                # check_earnings_data also returns None on errors, so only
+                # cache successful lookups
+                if earnings_info:
+                    results[ticker] = earnings_info
+                    self._cache_calendar(ticker, today, earnings_info)
+        
+        return results
+    
+    def _cache_calendar(self, ticker: str, day: str, earnings_info: Optional[Dict]):
+        """Cache a ticker's earnings info (None if it has no earnings date)."""
+        self.calendar_cache.set(
+            (ticker, day),
+            earnings_info,
+            expire=self.config.get('calendar_cache_hours', 6) * 3600
+        )
+    
+    def _get_quarter(self, earnings_date) -> str:
         """Convert date to quarter string."""
-        month = date.month
-        if month in [1, 2, 3]:
-            return "Q1"
-        elif month in [4, 5, 6]:
-            return "Q2"
-        elif month in [7, 8, 9]:
-            return "Q3"
-        else:
-            return "Q4"
+        return _QUARTER[earnings_date.month - 1]
     
     def generate_prompt(self, company_name: str, quarter: str, year: str, link: str) -> str:
         """Generate ChatGPT prompt for earnings summary."""
@@ -143,7 +402,7 @@ Tweet 3: Management commentary on business outlook
 Tweet 4: Strategic initiatives and market positioning
 Tweet 5: Guidance for future quarters/years
 
-Format your response as a JSON array with exactly 5 objects, each with a "tweet" field containing the tweet text.
+Format your response as a JSON object with a "tweets" array of exactly 5 objects, each with a "tweet" field containing the tweet text.
 Keep each tweet under 280 characters including hashtags.
 
 Example format:
@@ -161,24 +420,43 @@ Analyze the transcript at the link and generate the thread."""
 
     def get_chatgpt_summary(self, prompt: str) -> Optional[List[str]]:
         """Get summary from ChatGPT API."""
+        system_prompt = "You are a financial analyst that summarizes earnings call transcripts for Twitter."
+        max_tokens = 2000
+        
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a financial analyst that summarizes earnings call transcripts for Twitter."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
+            # Rough token estimate: ~4 characters per token plus the completion budget
+            estimated_tokens = (len(system_prompt) + len(prompt)) // 4 + max_tokens
+            
+            def create():
+                # Every attempt, including retries, counts against the quotas
+                self.openai_rpm_bucket.acquire()
+                self.openai_tpm_bucket.acquire(estimated_tokens)
+                return self.openai_client.chat.completions.create(
+                    model=self.config.get('openai_model', 'gpt-4o-mini'),
+                    response_format={"type": "json_object"},
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=max_tokens
+                )
+            
+            response = _call_with_backoff(create, _openai_retry_errors())
             
             result = response.choices[0].message.content
             
-            # Parse JSON response
-            import re
-            json_match = re.search(r'\{.*\}', result, re.DOTALL)
+            # JSON mode should return a bare JSON object
+            try:
+                data = orjson.loads(result)
+                return [item['tweet'] for item in data['tweets']]
+            except (ValueError, KeyError, TypeError):
+                pass
+            
+            # Otherwise look for a JSON object embedded in the response
+            json_match = _JSON_RE.search(result)
             if json_match:
-                data = json.loads(json_match.group())
+                data = orjson.loads(json_match.group())
                 return [item['tweet'] for item in data['tweets']]
             
             # Fallback: return raw response split into 5 parts
@@ -189,113 +467,176 @@ Analyze the transcript at the link and generate the thread."""
             print(f"Error getting ChatGPT summary: {e}")
             return None
     
+    def _cached_summary(self, ticker: str, quarter: str, year: str,
+                        prompt: str) -> Optional[List[str]]:
+        """
+        Get the ChatGPT summary for an earnings report.
+        Reuses a cached summary for the same (ticker, quarter, year), since
+        the prompt is derived from those.
+        """
+        key = (ticker, quarter, year)
+        tweets = self.summary_cache.get(key)
+        if tweets is None:
+            tweets = self.get_chatgpt_summary(prompt)
+            if tweets:
+                self.summary_cache.set(key, tweets, expire=SUMMARY_CACHE_SECONDS)
+                # Progress from an older, expired summary doesn't apply to this one
+                self.summary_cache.delete(('thread',) + key)
+        return tweets
+    
     def _split_into_tweets(self, text: str, n_tweets: int) -> List[str]:
         """Split text into approximately N tweets."""
-        # Simple splitting logic - could be improved
+        # Collect sentences in a list and join once per tweet, rather than
+        # growing a string; buffer_len counts each sentence plus its ". "
         sentences = text.split('. ')
         tweets = []
-        current_tweet = ""
+        buffer = []
+        buffer_len = 0
         
         for sentence in sentences:
-            if len(current_tweet) + len(sentence) < 260:
-                current_tweet += sentence + ". "
+            if buffer_len + len(sentence) < 260:
+                buffer.append(sentence)
+                buffer_len += len(sentence) + 2
             else:
-                if current_tweet:
-                    tweets.append(current_tweet.strip())
-                current_tweet = sentence + ". "
+                if buffer:
+                    tweets.append(('. '.join(buffer) + '.').strip())
+                    if len(tweets) == n_tweets:
+                        return tweets
+                buffer = [sentence]
+                buffer_len = len(sentence) + 2
         
-        if current_tweet and len(tweets) < n_tweets:
-            tweets.append(current_tweet.strip())
+        if buffer and len(tweets) < n_tweets:
+            tweets.append(('. '.join(buffer) + '.').strip())
         
-        return tweets[:n_tweets]
+        return tweets
     
-    def post_twitter_thread(self, tweets: List[str]) -> bool:
-        """Post tweets as a thread to Twitter."""
+    def post_twitter_thread(self, tweets: List[str], resume_key: Optional[tuple] = None) -> bool:
+        """
+        Post tweets as a thread to Twitter.
+        With resume_key, IDs of posted tweets are saved in the summary cache
+        as they go out, so a retry continues a partially posted thread
+        instead of re-posting (and being rejected for) duplicate tweets.
+        """
+        posted_ids = self.summary_cache.get(resume_key, []) if resume_key else []
+        if posted_ids:
+            print(f"Resuming thread after {len(posted_ids)} posted tweet(s)...")
+        
         try:
-            # Post first tweet
-            status = self.twitter_api.update_status(tweets[0])
-            previous_tweet = status
-            
-            # Post remaining tweets as replies
-            for tweet_text in tweets[1:]:
-                status = self.twitter_api.update_status(
-                    status=tweet_text,
-                    in_reply_to_status_id=previous_tweet.id,
-                    auto_populate_reply_metadata=True
+            for tweet_text in tweets[len(posted_ids):]:
+                # First tweet is standalone, the rest reply to the previous one
+                response = self.twitter_client.create_tweet(
+                    text=tweet_text,
+                    in_reply_to_tweet_id=posted_ids[-1] if posted_ids else None
                 )
-                previous_tweet = status
-                time.sleep(1)  # Rate limiting
+                posted_ids.append(response.json()['data']['id'])
+                if resume_key:
+                    self.summary_cache.set(resume_key, posted_ids, expire=SUMMARY_CACHE_SECONDS)
+                self._wait_for_twitter_rate_limit(response)
             
             return True
         except Exception as e:
             print(f"Error posting to Twitter: {e}")
             return False
     
+    def _wait_for_twitter_rate_limit(self, response: 'requests.Response'):
+        """Sleep until the rate limit window resets if no requests remain."""
+        remaining = response.headers.get('x-rate-limit-remaining')
+        reset = response.headers.get('x-rate-limit-reset')
+        if remaining is None or reset is None or int(remaining) > 0:
+            return
+        
+        delay = max(0, int(reset) - time.time())
+        print(f"Twitter rate limit reached, waiting {delay:.0f}s...")
+        time.sleep(delay)
+    
     def run_once(self):
         """Run one check cycle."""
         print(f"Checking earnings data at {datetime.now()}")
+        print(f"Checking {len(self.companies)} companies...")
         
-        for ticker, company_name in self.companies.items():
-            print(f"Checking {ticker} - {company_name}...")
+        earnings = self._fetch_calendars_batch(list(self.companies))
+        
+        new_earnings = []
+        for ticker, earnings_info in earnings.items():
+            quarter = earnings_info['quarter']
+            year = str(earnings_info['year'])
             
+            # Check if already processed
+            if not self._is_processed(ticker, quarter, year):
+                print(f"New earnings found for {ticker}!")
+                new_earnings.append(earnings_info)
+        
+        # OpenAI and Twitter share rate-limited credentials, so post sequentially
+        for earnings_info in new_earnings:
             try:
-                earnings_info = self.check_earnings_data(ticker)
-                
-                if earnings_info:
-                    quarter = earnings_info['quarter']
-                    year = str(earnings_info['year'])
-                    
-                    # Check if already processed
-                    if not self._is_processed(ticker, quarter, year):
-                        print(f"New earnings found for {ticker}!")
-                        
-                        # Generate summary
-                        prompt = self.generate_prompt(
-                            earnings_info['company_name'],
-                            quarter,
-                            year,
-                            earnings_info['link']
-                        )
-                        
-                        tweets = self.get_chatgpt_summary(prompt)
-                        
-                        if tweets:
-                            print(f"Posting thread for {ticker}...")
-                            success = self.post_twitter_thread(tweets)
-                            
-                            if success:
-                                self._mark_processed(
-                                    ticker,
-                                    quarter,
-                                    year,
-                                    earnings_info['link']
-                                )
-                                print(f"Successfully posted thread for {ticker}")
-                        else:
-                            print(f"Failed to generate summary for {ticker}")
-                
-                # Rate limiting
-                time.sleep(1)
-                
+                self._process_earnings(earnings_info)
             except Exception as e:
-                print(f"Error processing {ticker}: {e}")
+                print(f"Error processing {earnings_info['ticker']}: {e}")
                 continue
     
+    def _process_earnings(self, earnings_info: Dict):
+        """Summarize new earnings with ChatGPT and post the thread."""
+        ticker = earnings_info['ticker']
+        quarter = earnings_info['quarter']
+        year = str(earnings_info['year'])
+        
+        # Generate summary
+        prompt = self.generate_prompt(
+            earnings_info['company_name'],
+            quarter,
+            year,
+            earnings_info['link']
+        )
+        
+        tweets = self._cached_summary(ticker, quarter, year, prompt)
+        
+        if tweets:
+            print(f"Posting thread for {ticker}...")
+            success = self.post_twitter_thread(
+                tweets, resume_key=('thread', ticker, quarter, year)
+            )
+            
+            if success:
+                self._mark_processed(
+                    ticker,
+                    quarter,
+                    year,
+                    earnings_info['link']
+                )
+                print(f"Successfully posted thread for {ticker}")
+        else:
+            print(f"Failed to generate summary for {ticker}")
+    
     def run_continuous(self, interval_minutes: int = 60):
         """Run bot continuously, checking every interval_minutes."""
         print(f"Starting bot. Checking every {interval_minutes} minutes.")
         
+        # Checks start on a fixed cadence measured from startup, so the time
+        # spent in run_once doesn't push later checks back
+        interval = interval_minutes * 60
+        next_check = time.monotonic()
+        
         while True:
             try:
-                self.run_once()
-                print(f"Next check in {interval_minutes} minutes...")
-                time.sleep(interval_minutes * 60)
+                try:
+                    self.run_once()
+                except Exception as e:
+                    print(f"Error in main loop: {e}")
+                
+                next_check += interval
+                now = time.monotonic()
+                if now - next_check >= interval:
+                    # Fell more than a full interval behind; drop the missed checks
+                    missed = int((now - next_check) // interval)
+                    print(f"Warning: check cycle overran, skipping {missed} missed check(s)")
+                    next_check += missed * interval
+                
+                sleep_for = max(0, next_check - now)
+                print(f"Next check in {sleep_for / 60:.1f} minutes...")
+                time.sleep(sleep_for)
             except KeyboardInterrupt:
                 print("\nBot stopped by user.")
                 break
-            except Exception as e:
-                print(f"Error in main loop: {e}")
-                time.sleep(interval_minutes * 60)
 
 
 def main():